@@ -138,8 +138,7 @@ tipForce = FORCE_MULTIPLIER * E * Izz / beamLength**2
 # ourselves, we do this by finding the indices of the nodes whose x coordinate
 # is within a tolerance of the max X coordinate in the mesh
 tipNodeInds = np.nonzero(np.abs(np.max(nodeCoords[:, 0]) - nodeCoords[:, 0]) <= 1e-6)[0]
-nastranNodeNums = list(bdfInfo.node_ids)
-tipNodeIDs = [nastranNodeNums[ii] for ii in tipNodeInds]
+tipNodeIDs = np.array(list(bdfInfo.node_ids))[tipNodeInds]
 numTipNodes = len(tipNodeIDs)
 
 forceProblem.addLoadToNodes(
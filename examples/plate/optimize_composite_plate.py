@@ -2,15 +2,24 @@
 Mass minimization of uCRM wingbox subject to a constant vertical force
 """
 import os
+import argparse
 
 import openmdao.api as om
 import numpy as np
 from mphys import Multipoint
 from mphys.scenario_structural import ScenarioStructural
 
-from tacs import elements, constitutive, functions
+from tacs import TACS, elements, constitutive, functions
 from tacs.mphys import TacsBuilder
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n2", action="store_true", default=False)
+    args = parser.parse_args()
+    write_n2 = args.n2
+else:
+    write_n2 = False
+
 # BDF file containing mesh
 bdf_file = os.path.join(os.path.dirname(__file__), "partitioned_plate.bdf")
 
@@ -34,37 +43,44 @@ tMin = 0.002  # m
 tMax = 0.05  # m
 
 # Ply angles/initial ply fractions
-ply_angles = np.deg2rad([0.0, 45.0, -45.0, 90.0])
-ply_fractions = np.array([0.25, 0.25, 0.25, 0.25])
+ply_angles = np.deg2rad([0.0, 45.0, -45.0, 90.0]).astype(TACS.dtype)
+ply_fractions = np.array([0.25, 0.25, 0.25, 0.25], dtype=TACS.dtype)
+# Offsets of each ply fraction DV from the first DV number of an element
+ply_fraction_dv_offsets = np.arange(len(ply_angles), dtype=np.intc)
+
+# Reference axis to define local 0 deg direction
+refAxis = np.array([1.0, 0.0, 0.0])
 
 # Pressure load to apply to plate
 P = 100e3
 
+# Create ply object (shared by all elements)
+ortho_prop = constitutive.MaterialProperties(
+    rho=rho,
+    E1=E1,
+    E2=E2,
+    nu12=nu12,
+    G12=G12,
+    G13=G13,
+    G23=G13,
+    Xt=Xt,
+    Xc=Xc,
+    Yt=Yt,
+    Yc=Yc,
+    S12=S12,
+)
+ortho_ply = constitutive.OrthotropicPly(ply_thickness, ortho_prop)
+# Create the layup list (one for each angle)
+ortho_layup = [ortho_ply, ortho_ply, ortho_ply, ortho_ply]
+
+# Define shell transform using the reference axis (shared by all elements)
+transform = elements.ShellRefAxisTransform(refAxis)
+
 
 # Callback function used to setup TACS element objects and DVs
 def element_callback(dvNum, compID, compDescript, elemDescripts, specialDVs, **kwargs):
-    # Create ply object
-    ortho_prop = constitutive.MaterialProperties(
-        rho=rho,
-        E1=E1,
-        E2=E2,
-        nu12=nu12,
-        G12=G12,
-        G13=G13,
-        G23=G13,
-        Xt=Xt,
-        Xc=Xc,
-        Yt=Yt,
-        Yc=Yc,
-        S12=S12,
-    )
-    ortho_ply = constitutive.OrthotropicPly(ply_thickness, ortho_prop)
-    # Create the layup list (one for each angle)
-    ortho_layup = [ortho_ply, ortho_ply, ortho_ply, ortho_ply]
     # Assign each ply fraction a unique DV
-    ply_fraction_dv_nums = np.array(
-        [dvNum, dvNum + 1, dvNum + 2, dvNum + 3], dtype=np.intc
-    )
+    ply_fraction_dv_nums = dvNum + ply_fraction_dv_offsets
     # Create smeared stiffness object based on ply angles/fractions
     con = constitutive.SmearedCompositeShellConstitutive(
         ortho_layup,
@@ -74,10 +90,6 @@ def element_callback(dvNum, compID, compDescript, elemDescripts, specialDVs, **k
         ply_fraction_dv_nums=ply_fraction_dv_nums,
     )
 
-    # Define reference axis to define local 0 deg direction
-    refAxis = np.array([1.0, 0.0, 0.0])
-    transform = elements.ShellRefAxisTransform(refAxis)
-
     # Pass back the appropriate tacs element object
     elem = elements.Quad4Shell(transform, con)
 
@@ -155,8 +167,9 @@ prob.driver.options["optimizer"] = "SLSQP"
 # Setup OpenMDAO problem
 prob.setup()
 
-# Output N2 representation of OpenMDAO model
-om.n2(prob, show_browser=False, outfile="tacs_struct.html")
+# Output N2 representation of OpenMDAO model, if requested
+if write_n2:
+    om.n2(prob, show_browser=False, outfile="tacs_struct.html")
 
 # Run optimization
 prob.run_driver()
@@ -87,11 +87,9 @@ modalProb = FEAAssembler.createModalProblem("freq_analysis", sigma=0.8, numEigs=
 # Solve the modal problem
 modalProb.solve()
 # Print out each found eigenfrequency
-numFreqs = modalProb.getNumEigs()
-for i in range(numFreqs):
-    eigVal, _ = modalProb.getVariables(i)
-    # Frequency is the sqrt of the eigenvalue
-    freq = np.sqrt(eigVal)
+# Frequency is the sqrt of the eigenvalue
+freqs = modalProb.getFrequencies()
+for i, freq in enumerate(freqs):
     print(f"Mode {i+1}:")
     print(f"Frequency: {freq} (rad/s)")
     print(" ")
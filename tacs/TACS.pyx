@@ -1232,8 +1232,8 @@ cdef class Mg(Pc):
         self.mg.setMonitor(new KSMPrintStdout(descript, comm.rank, freq))
 
 cdef class KSM:
-    def __cinit__(self, Mat mat, Pc pc, int m,
-                  int nrestart=1, int isFlexible=0):
+    def __cinit__(self, Mat mat, Pc pc, int m=-1,
+                  int nrestart=1, int isFlexible=0, *args, **kwargs):
         """
         Create a GMRES object for solving a linear system with or
         without a preconditioner.
@@ -1244,10 +1244,25 @@ cdef class KSM:
         input:
         mat:        the matrix operator
         pc:         the preconditioner
-        m:          the size of the Krylov subspace
+        m:          the size of the Krylov subspace (required)
         nrestart:   the number of restarts before we give up
         isFlexible: is the preconditioner actually flexible? If so use FGMRES
+
+        Cython forwards the constructor arguments of the KsmPreconditioner
+        and GCROT subclasses to this method. The placeholder default for m
+        and the extra *args/**kwargs exist only so those calls work, they
+        are rejected when a GMRES object is created.
         """
+        self.ptr = NULL
+
+        # These derived classes allocate their own Krylov subspace method
+        if isinstance(self, (KsmPreconditioner, GCROT)):
+            return
+
+        if m < 0:
+            raise TypeError("KSM() missing required argument 'm'")
+        if args or kwargs:
+            raise TypeError("KSM() takes at most 5 arguments")
 
         self.ptr = new GMRES(mat.ptr, pc.ptr, m, nrestart, isFlexible)
         self.ptr.incref()
@@ -1312,6 +1327,49 @@ cdef class KSM:
         if gmres_ptr != NULL:
             gmres_ptr.setTimeMonitor()
 
+cdef class KsmPreconditioner(KSM):
+    def __cinit__(self, Mat mat, Pc pc):
+        """
+        Create a KSM object that solves the linear system by
+        applying the preconditioner only.
+
+        This is an exact solve when the preconditioner is a direct
+        factorization of the matrix (the default Pc for a Schur
+        matrix). No Krylov subspace is allocated and the solution
+        tolerances have no effect.
+
+        input:
+        mat:        the matrix operator
+        pc:         the (factored) preconditioner
+        """
+        self.ptr = new TACSKsmPreconditioner(mat.ptr, pc.ptr)
+        self.ptr.incref()
+        return
+
+cdef class GCROT(KSM):
+    def __cinit__(self, Mat mat, Pc pc, int outer=3, int max_outer=15,
+                  int msub=10, int isFlexible=0):
+        """
+        Create a GCROT object for solving a linear system with or
+        without a preconditioner.
+
+        This is a restarted GMRES variant that retains the outer
+        vectors from previous restarts to augment the Krylov subspace.
+        The required subspaces are allocated on initialization.
+
+        input:
+        mat:        the matrix operator
+        pc:         the preconditioner
+        outer:      the number of outer vectors retained across restarts
+        max_outer:  the maximum number of outer iterations before we give up
+        msub:       the size of the underlying GMRES subspace
+        isFlexible: is the preconditioner actually flexible? If so use FGMRES
+        """
+        self.ptr = new TACSGCROT(mat.ptr, pc.ptr, outer, max_outer,
+                                 msub, isFlexible)
+        self.ptr.incref()
+        return
+
 cdef class JacobiDavidsonOperator:
     def __cinit__(self, *args, **kwargs):
         self.ptr = NULL
@@ -3203,6 +3261,25 @@ cdef class FrequencyAnalysis:
         eigval = self.ptr.extractEigenvalue(index, &err)
         return eigval, err
 
+    def extractEigenvalues(self, int num):
+        """
+        Extract the first num eigenvalues in a single call.
+
+        Args:
+            num (int): The number of eigenvalues to extract
+
+        Returns:
+            (eigvals, errors): Arrays of the eigenvalues and error estimates
+        """
+        cdef int i = 0
+        cdef np.ndarray eigvals = np.zeros(num, dtype=dtype)
+        cdef np.ndarray errors = np.zeros(num, dtype=dtype)
+        cdef TacsScalar *eigvals_ptr = <TacsScalar*>eigvals.data
+        cdef TacsScalar *errors_ptr = <TacsScalar*>errors.data
+        for i in range(num):
+            eigvals_ptr[i] = self.ptr.extractEigenvalue(i, &errors_ptr[i])
+        return eigvals, errors
+
     def extractEigenvector(self, int index, Vec vec):
         """
         Extract the eigenvalue with the specified index.
@@ -153,6 +153,13 @@ cdef extern from "KSM.h":
               int _nrestart, int _isFlexible )
         void setTimeMonitor()
 
+    cdef cppclass TACSKsmPreconditioner "KsmPreconditioner"(TACSKsm):
+        TACSKsmPreconditioner(TACSMat *_mat, TACSPc *_pc)
+
+    cdef cppclass TACSGCROT "GCROT"(TACSKsm):
+        TACSGCROT(TACSMat *_mat, TACSPc *_pc, int _outer, int _max_outer,
+                  int _msub, int _isFlexible)
+
     cdef cppclass TACSBcMap(TACSObject):
         TACSBcMap(int, int)
 
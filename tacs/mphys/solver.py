@@ -26,6 +26,7 @@ class TacsSolver(om.ImplicitComponent):
 
         self.old_dvs = None
         self.old_xs = None
+        self.old_states = None
 
     def setup(self):
         self.check_partials = self.options["check_partials"]
@@ -116,6 +117,8 @@ class TacsSolver(om.ImplicitComponent):
         if self._need_update(inputs):
             self.sp.setDesignVars(inputs["tacs_dvs"])
             self.sp.setNodes(inputs["x_struct0"])
+            # Previously converged states no longer match the inputs
+            self.old_states = None
         if outputs is not None:
             self.sp.setVariables(outputs[self.states_name])
         self.sp._updateAssemblerVars()
@@ -139,6 +142,12 @@ class TacsSolver(om.ImplicitComponent):
             Fext = inputs[self.rhs_name]
         else:
             Fext = None
+            # Uncoupled solution only depends on the dvs and nodes,
+            # skip the solve if neither has changed since the last one
+            if self.old_states is not None:
+                self.sp.setVariables(self.old_states)
+                outputs[self.states_name] = self.old_states
+                return
 
         hasConverged = self.sp.solve(Fext=Fext)
         if not hasConverged:
@@ -148,6 +157,8 @@ class TacsSolver(om.ImplicitComponent):
             raise om.AnalysisError("TACS solver did not converge")
 
         self.sp.getVariables(states=outputs[self.states_name])
+        if not self.coupled:
+            self.old_states = outputs[self.states_name].copy()
 
     def solve_linear(self, d_outputs, d_residuals, mode):
         if mode == "fwd":
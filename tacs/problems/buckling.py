@@ -136,6 +136,9 @@ class BucklingProblem(TACSProblem):
         self.valName = "eigsb"
         self._initializeFunctionList()
 
+        # Only warn about unsupported functions once per problem
+        self._addFunctionWarned = False
+
         # Create problem-specific variables
         self._createVariables()
 
@@ -256,7 +259,9 @@ class BucklingProblem(TACSProblem):
         """
         NOT SUPPORTED FOR THIS PROBLEM
         """
-        self._TACSWarning("addFunction method not supported for this class.")
+        if not self._addFunctionWarned:
+            self._TACSWarning("addFunction method not supported for this class.")
+            self._addFunctionWarned = True
 
     def evalFunctions(self, funcs, evalFuncs=None, ignoreMissing=False):
         """
@@ -44,6 +44,14 @@ class ModalProblem(TACSProblem):
             "Artificial constant added to diagonals of RBE Lagrange multiplier stiffness matrix \n"
             "\t to stabilize preconditioner.",
         ],
+        "linearSolver": [
+            str,
+            "GMRES",
+            "Krylov subspace method used by Eigenvalue solver.\n"
+            "\t Accepts:\n"
+            "\t\t 'GMRES' : Restarted GMRES.\n"
+            "\t\t 'GCROT' : GMRES that retains outer vectors across restarts.",
+        ],
         "subSpaceSize": [
             int,
             10,
@@ -54,6 +62,20 @@ class ModalProblem(TACSProblem):
             15,
             "Max number of resets for Krylov solver used by Eigenvalue solver.",
         ],
+        "nOuterVectors": [
+            int,
+            3,
+            "Number of outer vectors retained across restarts by the 'GCROT' linearSolver.",
+        ],
+        "useDirectShiftInvert": [
+            bool,
+            False,
+            "Flag for applying the factored shifted stiffness matrix directly in the\n"
+            "\t shift-invert operator of the Eigenvalue solver, rather than through a Krylov solver.\n"
+            "\t Only exact when the preconditioner is a full factorization (the default).\n"
+            "\t No Krylov subspace is allocated, so linearSolver, subSpaceSize, nRestarts\n"
+            "\t and nOuterVectors have no effect when this is set.",
+        ],
         # Output Options
         "writeSolution": [bool, True, "Flag for suppressing all f5 file writing."],
         "numberSolutions": [
@@ -131,11 +153,16 @@ class ModalProblem(TACSProblem):
         # Set time eigenvalue parameters
         self.sigma = sigma
         self.numEigs = numEigs
+        # Indices of all modes, used when writing out every mode
+        self._allIndices = np.arange(numEigs)
 
         # String name used in evalFunctions
         self.valName = "eigsm"
         self._initializeFunctionList()
 
+        # Only warn about unsupported functions once per problem
+        self._addFunctionWarned = False
+
         # Create problem-specific variables
         self._createVariables()
 
@@ -149,23 +176,42 @@ class ModalProblem(TACSProblem):
         # Solve the eigenvalue problem
         self.M = self.assembler.createSchurMat()
         self.K = self.assembler.createSchurMat()
+        # Work vector for extracting eigenvectors
+        self.eigVec = self.assembler.createVec()
 
+        # The symbolic factorization of K is computed once here, each solve
+        # only repeats the numeric factorization of the shifted matrix
         self.pc = tacs.TACS.Pc(self.K)
 
-        # Set artificial stiffness factors in rbe class
-        c1 = self.getOption("RBEStiffnessScaleFactor")
-        c2 = self.getOption("RBEArtificialStiffness")
-        tacs.elements.RBE2.setScalingParameters(c1, c2)
-        tacs.elements.RBE3.setScalingParameters(c1, c2)
+        # The stiffness and mass matrices are assembled for the current
+        # design by the frequency analysis object during each solve
 
-        # Assemble and factor the stiffness/Jacobian matrix. Factor the
-        # Jacobian and solve the linear system for the displacements
-        self.assembler.assembleMatType(tacs.TACS.STIFFNESS_MATRIX, self.K)
-        self.assembler.assembleMatType(tacs.TACS.MASS_MATRIX, self.M)
+        # Create the eigenvalue solver
+        self._createSolver()
 
-        subspace = self.getOption("subSpaceSize")
-        restarts = self.getOption("nRestarts")
-        self.gmres = tacs.TACS.KSM(self.K, self.pc, subspace, restarts)
+    def _createSolver(self):
+        """
+        Internal to create the Krylov and eigenvalue solver objects
+        around the existing matrices and preconditioner
+        """
+        # The eigenvalue solver factors the shifted matrix (K - sigma * M) in the
+        # preconditioner, which can be applied directly if it is an exact factorization
+        if self.getOption("useDirectShiftInvert"):
+            self.linearSolver = tacs.TACS.KsmPreconditioner(self.K, self.pc)
+        else:
+            subspace = self.getOption("subSpaceSize")
+            restarts = self.getOption("nRestarts")
+            if self.getOption("linearSolver").upper() == "GMRES":
+                self.linearSolver = tacs.TACS.KSM(self.K, self.pc, subspace, restarts)
+            elif self.getOption("linearSolver").upper() == "GCROT":
+                outer = self.getOption("nOuterVectors")
+                self.linearSolver = tacs.TACS.GCROT(
+                    self.K, self.pc, outer, restarts, subspace
+                )
+            else:
+                raise self._TACSError(
+                    "Unknown linearSolver option. Valid options are 'GMRES' or 'GCROT'"
+                )
 
         atol = self.getOption("L2Convergence")
         rtol = self.getOption("L2ConvergenceRel")
@@ -176,12 +222,15 @@ class ModalProblem(TACSProblem):
             self.sigma,
             self.M,
             self.K,
-            self.gmres,
+            self.linearSolver,
             num_eigs=self.numEigs,
             eig_tol=atol,
             eig_atol=atol,
             eig_rtol=rtol,
         )
+        # Eigenvalues from the most recent solve
+        self.eigVals = np.zeros(self.numEigs, dtype=tacs.TACS.dtype)
+        self.eigErrors = np.zeros(self.numEigs, dtype=tacs.TACS.dtype)
 
     def _initializeFunctionList(self):
         """
@@ -204,20 +253,56 @@ class ModalProblem(TACSProblem):
         value : depends on option
             New option value to set
         """
+        # Check the Krylov method up front, since it may not be used
+        # until much later if the shifted matrix is applied directly
+        if (
+            name.lower() == "linearsolver"
+            and isinstance(value, str)
+            and value.upper() not in ["GMRES", "GCROT"]
+        ):
+            raise self._TACSError(
+                "Unknown linearSolver option. Valid options are 'GMRES' or 'GCROT'"
+            )
+
         # Default setOption for common problem class objects
         TACSProblem.setOption(self, name, value)
 
-        # No need to reset solver for output options
+        # Solver objects are not created until after the initial options are set
+        if not hasattr(self, "freqSolver"):
+            return
+
+        # No need to reset solver for output options or options
+        # that are applied before every solve
         if name.lower() in [
             "writesolution",
             "printtiming",
             "numbersolutions",
             "outputdir",
+            "printlevel",
+            "rbestiffnessscalefactor",
+            "rbeartificialstiffness",
         ]:
             pass
-        # Reset solver for all other option changes
-        else:
-            self._createVariables()
+        # Krylov solver options are not used when the factored
+        # shifted matrix is applied directly
+        elif name.lower() in [
+            "linearsolver",
+            "subspacesize",
+            "nrestarts",
+            "noutervectors",
+        ]:
+            if not self.getOption("useDirectShiftInvert"):
+                self._createSolver()
+        # Solver options only require new solver objects, the
+        # matrices and their symbolic factorization can be reused
+        elif name.lower() in [
+            "l2convergence",
+            "l2convergencerel",
+            "usedirectshiftinvert",
+        ]:
+            self._createSolver()
+        # Every valid option is handled above, invalid option names
+        # have already been rejected with a warning and need no update
 
     def setValName(self, valName):
         """
@@ -233,6 +318,31 @@ class ModalProblem(TACSProblem):
         self.valName = valName
         self._initializeFunctionList()
 
+    def setSigma(self, sigma):
+        """
+        Set the guess for the lowest eigenvalue. The existing matrices,
+        preconditioner and solvers are reused, so this is cheaper than
+        creating a new problem when sweeping over eigenvalue guesses.
+
+        Parameters
+        ----------
+        sigma : float
+            Guess for the lowest eigenvalue. This corresponds to the lowest frequency squared. (rad^2/s^2)
+        """
+        self.sigma = sigma
+        self.freqSolver.setSigma(sigma)
+
+    def getSigma(self):
+        """
+        Get the current guess for the lowest eigenvalue.
+
+        Returns
+        ----------
+        sigma : float
+            Guess for the lowest eigenvalue. (rad^2/s^2)
+        """
+        return self.sigma
+
     def getNumEigs(self):
         """
         Get the number of eigenvalues requested from solver for this problem.
@@ -244,11 +354,24 @@ class ModalProblem(TACSProblem):
         """
         return self.numEigs
 
+    def getFrequencies(self):
+        """
+        Get the eigenfrequencies for all modes of the current problem.
+
+        Returns
+        ----------
+        freqs : numpy.ndarray
+            Eigenfrequency for each mode, square root of the eigenvalues (rad/s).
+        """
+        return np.sqrt(self.eigVals)
+
     def addFunction(self, funcName, funcHandle, compIDs=None, **kwargs):
         """
         NOT SUPPORTED FOR THIS PROBLEM
         """
-        self._TACSWarning("addFunction method not supported for this class.")
+        if not self._addFunctionWarned:
+            self._TACSWarning("addFunction method not supported for this class.")
+            self._addFunctionWarned = True
 
     def evalFunctions(self, funcs, evalFuncs=None, ignoreMissing=False):
         """
@@ -301,7 +424,7 @@ class ModalProblem(TACSProblem):
         for funcName in evalFuncs:
             mode_i = evalFuncs[funcName]
             key = f"{self.name}_{funcName}"
-            funcs[key], _ = self.getVariables(mode_i)
+            funcs[key] = self.eigVals[mode_i]
 
     def evalFunctionsSens(self, funcsSens, evalFuncs=None):
         """
@@ -377,49 +500,45 @@ class ModalProblem(TACSProblem):
         """
         Solve the eigenvalue problem.
         """
-        startTime = time.time()
+        startTime = time.perf_counter()
 
         self.callCounter += 1
 
-        setupProblemTime = time.time()
+        setupProblemTime = time.perf_counter()
 
         # Set problem vars to assembler
         self._updateAssemblerVars()
 
-        initSolveTime = time.time()
+        initSolveTime = time.perf_counter()
 
         # Solve the frequency analysis problem
-        self.freqSolver.solve(
-            print_flag=self.getOption("printLevel"),
-            print_level=self.getOption("printLevel"),
-        )
+        printLevel = self.getOption("printLevel")
+        self.freqSolver.solve(print_flag=printLevel, print_level=printLevel)
 
-        solveTime = time.time()
+        # Extract all eigenvalues at once, so they can be queried without the solver
+        self.eigVals, self.eigErrors = self.freqSolver.extractEigenvalues(self.numEigs)
+
+        solveTime = time.perf_counter()
 
         # If timing was was requested print it, if the solution is nonlinear
         # print this information automatically if prinititerations was requested.
         if self.getOption("printTiming"):
-            self._pp("+--------------------------------------------------+")
-            self._pp("|")
-            self._pp("| TACS Solve Times:")
-            self._pp("|")
-            self._pp(
+            timingLines = [
+                "+--------------------------------------------------+",
+                "|",
+                "| TACS Solve Times:",
+                "|",
                 "| %-30s: %10.3f sec"
-                % ("TACS Setup Time", setupProblemTime - startTime)
-            )
-            self._pp(
+                % ("TACS Setup Time", setupProblemTime - startTime),
                 "| %-30s: %10.3f sec"
-                % ("TACS Solve Init Time", initSolveTime - setupProblemTime)
-            )
-            self._pp(
-                "| %-30s: %10.3f sec" % ("TACS Solve Time", solveTime - initSolveTime)
-            )
-            self._pp("|")
-            self._pp(
+                % ("TACS Solve Init Time", initSolveTime - setupProblemTime),
+                "| %-30s: %10.3f sec" % ("TACS Solve Time", solveTime - initSolveTime),
+                "|",
                 "| %-30s: %10.3f sec"
-                % ("TACS Total Solution Time", solveTime - startTime)
-            )
-            self._pp("+--------------------------------------------------+")
+                % ("TACS Total Solution Time", solveTime - startTime),
+                "+--------------------------------------------------+",
+            ]
+            self._pp("\n".join(timingLines))
 
         return
 
@@ -441,17 +560,40 @@ class ModalProblem(TACSProblem):
             Eigenvalue for mode corresponds to square of eigenfrequency (rad^2/s^2)
 
         states : numpy.ndarray
-            Eigenvector for mode
+            Eigenvector for mode. If states was provided, this shares its data.
+        """
+        return self.eigVals[index], self.getEigenvector(index, states)
+
+    def getEigenvector(self, index, states=None):
+        """
+        Return the eigenvector for one mode of the current problem,
+        without extracting its eigenvalue
+
+        Parameters
+        ----------
+        index : int
+            Mode index to return eigenvector for.
+
+        states : tacs.TACS.Vec or numpy.ndarray or None
+            Place eigenvector for mode into this array (optional).
+
+        Returns
+        --------
+        states : numpy.ndarray
+            Eigenvector for mode. If states was provided, this shares its data.
         """
-        eigVal, err = self.freqSolver.extractEigenvalue(index)
-        eigVector = self.assembler.createVec()
-        self.freqSolver.extractEigenvector(index, eigVector)
         # Inplace assignment if vectors were provided
         if isinstance(states, tacs.TACS.Vec):
-            states.copyValues(eigVector)
+            self.freqSolver.extractEigenvector(index, states)
+            return states.getArray()
         elif isinstance(states, np.ndarray):
-            states[:] = eigVector.getArray()
-        return eigVal, eigVector.getArray()
+            self.freqSolver.extractEigenvector(index, self.eigVec)
+            states[:] = self.eigVec.getArray()
+            return states
+        # Otherwise, return the eigenvector in a new vector
+        eigVector = self.assembler.createVec()
+        self.freqSolver.extractEigenvector(index, eigVector)
+        return eigVector.getArray()
 
     def writeSolution(self, outputDir=None, baseName=None, number=None, indices=None):
         """
@@ -502,17 +644,17 @@ class ModalProblem(TACSProblem):
         if self.getOption("writeSolution"):
             # If indices is None, output all modes
             if indices is None:
-                indices = np.arange(self.numEigs)
+                indices = self._allIndices
+            else:
+                indices = np.atleast_1d(indices)
 
             # Write out each specified mode
-            indices = np.atleast_1d(indices)
-            vec = self.assembler.createVec()
+            filePrefix = os.path.join(outputDir, baseName) + "_"
             for index in indices:
-                # Extract eigenvector
-                eig, _ = self.getVariables(index, states=vec)
+                # Extract eigenvector only, eigenvalue is not needed here
+                self.getEigenvector(index, self.eigVec)
                 # Set eigen mode in assembler
-                self.assembler.setVariables(vec)
+                self.assembler.setVariables(self.eigVec)
                 # Write out mode shape as f5 file
-                modeName = baseName + "_%3.3d" % index
-                fileName = os.path.join(outputDir, modeName) + ".f5"
+                fileName = f"{filePrefix}{index:03d}.f5"
                 self.outputViewer.writeToFile(fileName)
@@ -0,0 +1,160 @@
+import os
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from mphys.multipoint import Multipoint
+from mphys.scenario_structural import ScenarioStructural
+
+import tacs.mphys
+from tacs import elements, constitutive, functions
+
+"""
+This is a simple 1m by 2m plate made up of four quad shell elements.
+The plate is structurally loaded under a 100G gravity load only, so the
+TACS solver in the MPhys scenario is uncoupled. This tests that the solver
+skips repeated solves at the same design, re-solves when the design changes,
+and that the reused states match a fresh solve.
+"""
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+bdf_file = os.path.join(base_dir, "./input_files/debug_plate.bdf")
+
+# KS function weight
+ksweight = 10.0
+
+
+def setup_problem():
+    """
+    Setup uncoupled openmdao problem object we will be testing.
+    """
+
+    # Callback function used to setup TACS element objects and DVs
+    def element_callback(
+        dv_num, comp_id, comp_descript, elem_descripts, special_dvs, **kwargs
+    ):
+        rho = 2780.0  # density, kg/m^3
+        E = 73.1e9  # elastic modulus, Pa
+        nu = 0.33  # poisson's ratio
+        ys = 324.0e6  # yield stress, Pa
+        thickness = 0.01
+        min_thickness = 0.002
+        max_thickness = 0.05
+
+        # Setup (isotropic) property and constitutive objects
+        prop = constitutive.MaterialProperties(rho=rho, E=E, nu=nu, ys=ys)
+        # Set one thickness dv for every component
+        con = constitutive.IsoShellConstitutive(
+            prop, t=thickness, tNum=dv_num, tlb=min_thickness, tub=max_thickness
+        )
+
+        # For each element type in this component,
+        # pass back the appropriate tacs element object
+        transform = None
+        elem = elements.Quad4Shell(transform, con)
+
+        return elem
+
+    def problem_setup(scenario_name, fea_assembler, problem):
+        """
+        Helper function to add fixed forces and eval functions
+        to structural problems used in tacs builder
+        """
+        # Set convergence to be tight for test
+        problem.setOption("L2Convergence", 1e-20)
+        problem.setOption("L2ConvergenceRel", 1e-20)
+
+        # Add TACS Functions
+        problem.addFunction("mass", functions.StructuralMass)
+        problem.addFunction("ks_vmfailure", functions.KSFailure, ksWeight=ksweight)
+
+        # Add gravity load
+        g = np.array([0.0, 0.0, -9.81]) * 100  # m/s^2
+        problem.addInertialLoad(g)
+
+    tacs_builder = tacs.mphys.TacsBuilder(
+        mesh_file=bdf_file,
+        element_callback=element_callback,
+        problem_setup=problem_setup,
+        coupled=False,
+        write_solution=False,
+    )
+
+    class Top(Multipoint):
+        def setup(self):
+            tacs_builder.initialize(self.comm)
+
+            dvs = self.add_subsystem("dvs", om.IndepVarComp(), promotes=["*"])
+            structDVs = tacs_builder.get_initial_dvs()
+            dvs.add_output("dv_struct", structDVs)
+
+            self.add_subsystem("mesh", tacs_builder.get_mesh_coordinate_subsystem())
+            self.mphys_add_scenario(
+                "analysis", ScenarioStructural(struct_builder=tacs_builder)
+            )
+            self.connect("mesh.x_struct0", "analysis.x_struct0")
+            self.connect("dv_struct", "analysis.dv_struct")
+
+    prob = om.Problem()
+    prob.model = Top()
+    prob.setup()
+
+    return prob
+
+
+class ProblemTest(unittest.TestCase):
+    N_PROCS = 2  # this is how many MPI processes to use for this TestCase.
+
+    def get_states(self, prob):
+        """
+        Get a copy of the local states computed by the TACS solver component
+        """
+        return prob.get_val(
+            "analysis.coupling.solver.u_struct", get_remote=False
+        ).copy()
+
+    def test_solve_skipping(self):
+        """
+        Test that repeated runs at the same inputs reuse the previous solution
+        and that changing the design triggers a new solve
+        """
+        prob = setup_problem()
+        sp = prob.model.analysis.coupling.solver.sp
+
+        prob.run_model()
+        callCount = sp.callCounter
+        states = self.get_states(prob)
+        ks = prob.get_val("analysis.ks_vmfailure").copy()
+
+        # A second run at the same inputs should not solve again
+        prob.run_model()
+        self.assertEqual(sp.callCounter, callCount)
+        np.testing.assert_array_equal(self.get_states(prob), states)
+        np.testing.assert_array_equal(prob.get_val("analysis.ks_vmfailure"), ks)
+
+        # Changing the design should trigger a new solve
+        newDVs = 1.5 * prob.get_val("dv_struct")
+        prob.set_val("dv_struct", newDVs)
+        prob.run_model()
+        self.assertEqual(sp.callCounter, callCount + 1)
+
+        # A repeated run at the new design should reuse the new solution
+        prob.run_model()
+        self.assertEqual(sp.callCounter, callCount + 1)
+
+        # The reused solution should match a fresh solve at the same design
+        freshProb = setup_problem()
+        freshProb.set_val("dv_struct", newDVs)
+        freshProb.run_model()
+        np.testing.assert_allclose(
+            self.get_states(prob), self.get_states(freshProb), rtol=1e-10, atol=1e-20
+        )
+        np.testing.assert_allclose(
+            prob.get_val("analysis.ks_vmfailure"),
+            freshProb.get_val("analysis.ks_vmfailure"),
+            rtol=1e-10,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
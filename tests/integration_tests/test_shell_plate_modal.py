@@ -1,5 +1,7 @@
 import os
 
+import numpy as np
+
 from pytacs_analysis_base_test import PyTACSTestCase
 from tacs import pytacs, elements, constitutive
 
@@ -32,6 +34,21 @@ class ProblemTest(PyTACSTestCase.PyTACSTest):
         "modal_eigsm.2": 6329530.425710541,
         "modal_eigsm.3": 13800023.12391336,
         "modal_eigsm.4": 23935675.376059294,
+        "modal_direct_eigsm.0": 1396464.9023496218,
+        "modal_direct_eigsm.1": 6329530.425709786,
+        "modal_direct_eigsm.2": 6329530.425710541,
+        "modal_direct_eigsm.3": 13800023.12391336,
+        "modal_direct_eigsm.4": 23935675.376059294,
+        "modal_sigma_eigsm.0": 1396464.9023496218,
+        "modal_sigma_eigsm.1": 6329530.425709786,
+        "modal_sigma_eigsm.2": 6329530.425710541,
+        "modal_sigma_eigsm.3": 13800023.12391336,
+        "modal_sigma_eigsm.4": 23935675.376059294,
+        "modal_gcrot_eigsm.0": 1396464.9023496218,
+        "modal_gcrot_eigsm.1": 6329530.425709786,
+        "modal_gcrot_eigsm.2": 6329530.425710541,
+        "modal_gcrot_eigsm.3": 13800023.12391336,
+        "modal_gcrot_eigsm.4": 23935675.376059294,
     }
 
     def setup_tacs_problems(self, comm):
@@ -81,4 +98,60 @@ class ProblemTest(PyTACSTestCase.PyTACSTest):
 
         modal_prob = fea_assembler.createModalProblem("modal", 1.0e6, 10)
 
-        return [modal_prob], fea_assembler
+        # Same problem, but apply the factored shifted matrix without a Krylov solver
+        direct_prob = fea_assembler.createModalProblem("modal_direct", 1.0e6, 10)
+        direct_prob.setOption("useDirectShiftInvert", True)
+
+        # Same problem, but with the eigenvalue guess updated after creation
+        sigma_prob = fea_assembler.createModalProblem("modal_sigma", 1.0e5, 10)
+        sigma_prob.setSigma(1.0e6)
+
+        # Same problem, but with GCROT for the shift-invert linear solves
+        gcrot_prob = fea_assembler.createModalProblem("modal_gcrot", 1.0e6, 10)
+        gcrot_prob.setOption("linearSolver", "GCROT")
+
+        return [modal_prob, direct_prob, sigma_prob, gcrot_prob], fea_assembler
+
+    def test_get_frequencies(self):
+        """
+        Test that the frequencies are the square root of the eigenvalues
+        """
+        self.run_solve()
+        for prob in self.tacs_probs:
+            with self.subTest(problem=prob.name):
+                freqs = prob.getFrequencies()
+                self.assertEqual(len(freqs), prob.getNumEigs())
+                for mode_i, freq in enumerate(freqs):
+                    func_key = f"{prob.name}_eigsm.{mode_i}"
+                    if func_key in self.FUNC_REFS:
+                        np.testing.assert_allclose(
+                            freq,
+                            np.sqrt(self.FUNC_REFS[func_key]),
+                            rtol=self.rtol,
+                            atol=self.atol,
+                        )
+
+    def test_get_eigenvector(self):
+        """
+        Test that the eigenvector is the same whether it is placed into a
+        Vec, a numpy array or a new array, and that provided states are filled in place
+        """
+        self.run_solve()
+        for prob in self.tacs_probs:
+            with self.subTest(problem=prob.name):
+                for mode_i in range(prob.getNumEigs()):
+                    eigVec = prob.getEigenvector(mode_i)
+
+                    vec = prob.assembler.createVec()
+                    vecArray = prob.getEigenvector(mode_i, states=vec)
+                    self.assertTrue(np.shares_memory(vecArray, vec.getArray()))
+                    np.testing.assert_array_equal(vecArray, eigVec)
+
+                    array = np.zeros_like(eigVec)
+                    arrayOut = prob.getEigenvector(mode_i, states=array)
+                    self.assertIs(arrayOut, array)
+                    np.testing.assert_array_equal(array, eigVec)
+
+                    # getVariables should return the same eigenvector
+                    _, states = prob.getVariables(mode_i)
+                    np.testing.assert_array_equal(states, eigVec)